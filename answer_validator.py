@@ -3,54 +3,100 @@ Answer validation utilities for COMPU LOGIC
 Provides robust answer checking with normalization and fuzzy matching
 """
 
-import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
+
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+try:
+    from polyleven import levenshtein
+except ImportError:
+    levenshtein = None
+
+_PUNCT_TABLE = str.maketrans('', '', '.,;:!?"')
+
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Normalize text for comparison (memoized across validations)"""
+    if not text:
+        return ""
+    # Lowercase, drop punctuation that doesn't affect meaning, then collapse
+    # and strip whitespace; split()/join() does the last two in one C pass
+    return " ".join(text.lower().translate(_PUNCT_TABLE).split())
+
+@dataclass(frozen=True)
+class PreparedAnswer:
+    """Correct answer normalized once for validating many user answers"""
+    norm: str
+    length: int
+
 class AnswerValidator:
     """Validates user answers against correct answers with multiple strategies"""
     
     @staticmethod
     def normalize_text(text: str) -> str:
         """Normalize text for comparison"""
-        if not text:
-            return ""
-        # Convert to lowercase and strip whitespace
-        normalized = text.lower().strip()
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-        # Remove punctuation that doesn't affect meaning
-        normalized = re.sub(r'[.,;:!?"]', '', normalized)
-        return normalized
+        return _normalize(text)
     
     @staticmethod
-    def check_exact_match(user_answer: str, correct_answer: str) -> bool:
-        """Check for exact match after normalization"""
-        return AnswerValidator.normalize_text(user_answer) == AnswerValidator.normalize_text(correct_answer)
+    def _check_exact_norm(user_norm: str, correct_norm: str) -> bool:
+        return user_norm == correct_norm
     
     @staticmethod
-    def check_substring_match(user_answer: str, correct_answer: str) -> bool:
-        """Check if user answer is contained in correct answer"""
-        user_norm = AnswerValidator.normalize_text(user_answer)
-        correct_norm = AnswerValidator.normalize_text(correct_answer)
-        
+    def _check_substring_norm(user_norm: str, correct_norm: str) -> bool:
         if not user_norm or not correct_norm:
             return False
             
         return user_norm in correct_norm
     
     @staticmethod
-    def check_fuzzy_match(user_answer: str, correct_answer: str, threshold: float = 0.8) -> bool:
-        """Check similarity using fuzzy matching"""
-        user_norm = AnswerValidator.normalize_text(user_answer)
-        correct_norm = AnswerValidator.normalize_text(correct_answer)
-        
+    def _check_fuzzy_norm(user_norm: str, correct_norm: str, threshold: float = 0.8) -> bool:
         if not user_norm or not correct_norm:
             return False
-            
+
+        # All three similarity scores are bounded above by 2*min(la, lb)/(la + lb):
+        # RapidFuzz and difflib ratios directly, and the Levenshtein ratio since
+        # 1 - d/max(la, lb) <= min/max <= 2*min/(la + lb). So skip pairs whose
+        # lengths alone rule out reaching the threshold
+        la, lb = len(user_norm), len(correct_norm)
+        if 2.0 * min(la, lb) / (la + lb) < threshold:
+            return False
+
+        if fuzz is not None:
+            # score_cutoff lets RapidFuzz bail out early on hopeless pairs
+            cutoff = threshold * 100
+            return fuzz.ratio(user_norm, correct_norm, score_cutoff=cutoff) >= cutoff
+
+        if levenshtein is not None:
+            # Ratio 1 - dist/max_len clears the threshold iff dist <= k, and
+            # polyleven stops computing as soon as the distance exceeds k
+            k = int((1.0 - threshold) * max(la, lb) + 1e-9)
+            return levenshtein(user_norm, correct_norm, k) <= k
+
         similarity = SequenceMatcher(None, user_norm, correct_norm).ratio()
         return similarity >= threshold
     
+    @staticmethod
+    def check_exact_match(user_answer: str, correct_answer: str) -> bool:
+        """Check for exact match after normalization"""
+        return AnswerValidator._check_exact_norm(_normalize(user_answer), _normalize(correct_answer))
+    
+    @staticmethod
+    def check_substring_match(user_answer: str, correct_answer: str) -> bool:
+        """Check if user answer is contained in correct answer"""
+        return AnswerValidator._check_substring_norm(_normalize(user_answer), _normalize(correct_answer))
+    
+    @staticmethod
+    def check_fuzzy_match(user_answer: str, correct_answer: str, threshold: float = 0.8) -> bool:
+        """Check similarity using fuzzy matching"""
+        return AnswerValidator._check_fuzzy_norm(_normalize(user_answer), _normalize(correct_answer), threshold)
+    
     @staticmethod
     def validate_answer(user_answer: str, correct_answer: str) -> Tuple[bool, str]:
         """
@@ -59,13 +105,28 @@ class AnswerValidator:
         Returns:
             Tuple of (is_correct, feedback_message)
         """
-        if AnswerValidator.check_exact_match(user_answer, correct_answer):
+        return AnswerValidator._validate_norm(_normalize(user_answer), _normalize(correct_answer))
+    
+    @staticmethod
+    def prepare(correct_answer: str) -> PreparedAnswer:
+        """Normalize a correct answer once for repeated validation"""
+        norm = _normalize(correct_answer)
+        return PreparedAnswer(norm=norm, length=len(norm))
+    
+    @staticmethod
+    def validate_against(user_answer: str, prepared: PreparedAnswer) -> Tuple[bool, str]:
+        """Validate a user answer against a prepared correct answer"""
+        return AnswerValidator._validate_norm(_normalize(user_answer), prepared.norm)
+    
+    @staticmethod
+    def _validate_norm(user_norm: str, correct_norm: str) -> Tuple[bool, str]:
+        if AnswerValidator._check_exact_norm(user_norm, correct_norm):
             return True, "Exact match!"
         
-        if AnswerValidator.check_substring_match(user_answer, correct_answer):
+        if AnswerValidator._check_substring_norm(user_norm, correct_norm):
             return True, "Correct concept identified!"
         
-        if AnswerValidator.check_fuzzy_match(user_answer, correct_answer):
+        if AnswerValidator._check_fuzzy_norm(user_norm, correct_norm):
             return True, "Close enough - good understanding!"
         
         return False, "Answer needs improvement"
@@ -3,6 +3,8 @@ Enhanced question generation with better distractors and mathematical precision
 """
 
 import random
+import re
+import sys
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
 
@@ -15,53 +17,121 @@ class GlossaryEntry:
     difficulty: int  # 1-5
     related_terms: List[str]
 
+def _interned(table: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Intern every key and value so comparisons against (interned) entry
+    categories short-circuit on identity"""
+    return {
+        sys.intern(key): tuple(map(sys.intern, values))
+        for key, values in table.items()
+    }
+
+# Plausible wrong categories offered for each category
+_CATEGORY_DISTRACTORS: Dict[str, Tuple[str, ...]] = _interned({
+    "Set Theory": ("Functions", "Relations", "Orderings", "Graphs", "Multisets"),
+    "Functions": ("Set Theory", "Relations", "Orderings", "Data Structures", "Multisets"),
+    "Relations": ("Set Theory", "Functions", "Orderings", "Graphs", "Data Structures"),
+    "Orderings": ("Set Theory", "Functions", "Relations", "Graphs", "Data Structures"),
+    "Graphs": ("Set Theory", "Functions", "Relations", "Orderings", "Data Structures"),
+    "Multisets": ("Set Theory", "Functions", "Relations", "Orderings", "Graphs"),
+    "Data Structures": ("Set Theory", "Functions", "Relations", "Orderings", "Graphs"),
+    "General": ("Set Theory", "Functions", "Relations", "Orderings", "Graphs")
+})
+
+# Common misconception patterns
+_MISCONCEPTIONS: Dict[str, Tuple[str, ...]] = {
+    "Cartesian Product": (
+        "A Cartesian product is commutative, so X × Y = Y × X",
+        "The Cartesian product of a set with itself is just the set",
+        "Cartesian products can only be formed between two sets"
+    ),
+    "Equivalence Relation": (
+        "An equivalence relation only needs to be reflexive and symmetric",
+        "Transitivity means if aRb then bRa",
+        "Any symmetric relation is automatically an equivalence relation"
+    ),
+    "Function": (
+        "All functions are bijective",
+        "Injective functions must also be surjective",
+        "Functions can map one input to multiple outputs"
+    ),
+    "SMT Solver": (
+        "SMT solvers can solve any logical formula",
+        "SMT solvers always return a model for satisfiable formulas",
+        "SMT solvers work by trying all possible assignments"
+    )
+}
+
+# Fallback distractors appended to every definition question
+_GENERIC_MISCONCEPTIONS = (
+    "This concept is only applicable in theoretical mathematics with no practical use",
+    "This is a simple concept that doesn't require formal definition",
+    "This concept is equivalent to its opposite in all contexts"
+)
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text[:limit] + "..." if len(text) > limit else text
+
 class EnhancedQuestionGenerator:
     """Generates high-quality questions for theoretical computer science concepts"""
     
+    category_distractors = _CATEGORY_DISTRACTORS
+    misconceptions = _MISCONCEPTIONS
+    
     def __init__(self, glossary_entries: Dict[str, GlossaryEntry]):
         self.glossary = glossary_entries
+        # Lowercased index built once so lookups don't depend on caller key casing
+        self._glossary_lc = {k.lower(): v for k, v in self.glossary.items()}
+        self._term_lower = {k: e.term.lower() for k, e in self._glossary_lc.items()}
         self._prepare_distractors()
+        self._precompute_entries()
     
     def _prepare_distractors(self):
-        """Prepare plausible distractors for different categories"""
-        self.category_distractors = {
-            "Set Theory": ["Functions", "Relations", "Orderings", "Graphs", "Multisets"],
-            "Functions": ["Set Theory", "Relations", "Orderings", "Data Structures", "Multisets"],
-            "Relations": ["Set Theory", "Functions", "Orderings", "Graphs", "Data Structures"],
-            "Orderings": ["Set Theory", "Functions", "Relations", "Graphs", "Data Structures"],
-            "Graphs": ["Set Theory", "Functions", "Relations", "Orderings", "Data Structures"],
-            "Multisets": ["Set Theory", "Functions", "Relations", "Orderings", "Graphs"],
-            "Data Structures": ["Set Theory", "Functions", "Relations", "Orderings", "Graphs"],
-            "General": ["Set Theory", "Functions", "Relations", "Orderings", "Graphs"]
-        }
-        
-        # Common misconception patterns
-        self.misconceptions = {
-            "Cartesian Product": [
-                "A Cartesian product is commutative, so X × Y = Y × X",
-                "The Cartesian product of a set with itself is just the set",
-                "Cartesian products can only be formed between two sets"
-            ],
-            "Equivalence Relation": [
-                "An equivalence relation only needs to be reflexive and symmetric",
-                "Transitivity means if aRb then bRa",
-                "Any symmetric relation is automatically an equivalence relation"
-            ],
-            "Function": [
-                "All functions are bijective",
-                "Injective functions must also be surjective",
-                "Functions can map one input to multiple outputs"
-            ],
-            "SMT Solver": [
-                "SMT solvers can solve any logical formula",
-                "SMT solvers always return a model for satisfiable formulas",
-                "SMT solvers work by trying all possible assignments"
-            ]
+        """Build lookup indexes over the shared distractor tables"""
+        # Single alternation pattern so each term is scanned once for all keys
+        self._misc_map = {k.lower(): v for k, v in self.misconceptions.items()}
+        self._misc_re = re.compile('|'.join(re.escape(k) for k in self._misc_map))
+        # Distractor options are shown truncated; do that once here
+        self._misconceptions_trunc = {
+            k: tuple(_truncate(m, 120) for m in v) for k, v in self._misc_map.items()
         }
     
+    def _precompute_entries(self):
+        """Precompute per-entry snippets reused on every question"""
+        self._precomputed: Dict[str, Dict[str, Optional[str]]] = {}
+        for key, entry in self._glossary_lc.items():
+            definition = entry.definition
+            sentences = definition.split('.')
+            relationship_answer = f"According to the definition: {definition}"
+            misc_match = self._misc_re.search(self._term_lower[key])
+            # Prefer a sentence that gives an example; the first sentence
+            # often carries the key info otherwise
+            example_answer = next((s.strip() for s in sentences if 'example' in s.lower()), None)
+            if not example_answer:
+                example_answer = sentences[0] + "."
+            self._precomputed[key] = {
+                'first_sentence_trunc120': _truncate(sentences[0].strip() + ".", 120) if len(sentences) > 1 else None,
+                'trunc120': definition[:120] + "...",
+                'trunc150': definition[:150] + "...",
+                'relationship_answer': relationship_answer,
+                'relationship_trunc150': relationship_answer[:150] + "...",
+                'example_answer': example_answer,
+                'example_trunc150': example_answer[:150] + "...",
+                'misc_key': misc_match.group(0) if misc_match else None,
+            }
+    
+    @staticmethod
+    def _assemble_options(correct: str, distractors: List[str]) -> Tuple[List[str], int]:
+        """Insert the correct answer at a uniformly random position among the distractors"""
+        idx = random.randrange(len(distractors) + 1)
+        options = list(distractors)
+        options.insert(idx, correct)
+        return options, idx
+    
     def generate_definition_question(self, term: str) -> Tuple[str, str, List[str]]:
         """Generate a precise definition-based question"""
-        entry = self.glossary.get(term.lower())
+        term_lower = term.lower()
+        entry = self._glossary_lc.get(term_lower)
         if not entry:
             return "", "", []
             
@@ -69,63 +139,59 @@ class EnhancedQuestionGenerator:
         correct_answer = entry.definition
         
         # Generate sophisticated distractors
-        distractors = self._generate_definition_distractors(entry)
-        options = [correct_answer[:120] + "..."] + distractors
-        random.shuffle(options)
+        distractors = self._generate_definition_distractors(entry, term_lower)
+        options, _ = self._assemble_options(self._precomputed[term_lower]['trunc120'], distractors)
         
         return question, correct_answer, options
     
-    def _generate_definition_distractors(self, entry: GlossaryEntry) -> List[str]:
+    def _generate_definition_distractors(self, entry: GlossaryEntry, key: str) -> List[str]:
         """Generate plausible definition distractors"""
         distractors = []
-        all_terms = list(self.glossary.keys())
         
         # Add category-based misconceptions if available
-        for misconception_term, misconceptions in self.misconceptions.items():
-            if misconception_term.lower() in entry.term.lower():
-                distractors.extend(misconceptions)
-                break
+        misc_key = self._precomputed[key]['misc_key']
+        if misc_key is not None:
+            distractors.extend(self._misconceptions_trunc[misc_key])
         
         # Add related term definitions (wrongly applied)
         for related_term in entry.related_terms[:2]:
-            related_entry = self.glossary.get(related_term.lower())
+            related_key = related_term.lower()
+            related_entry = self._glossary_lc.get(related_key)
             if related_entry and len(distractors) < 3:
                 # Take a portion that sounds plausible but is wrong
-                parts = related_entry.definition.split('.')
-                if len(parts) > 1:
-                    distractors.append(parts[0].strip() + ".")
+                first_sentence = self._precomputed[related_key]['first_sentence_trunc120']
+                if first_sentence is not None:
+                    distractors.append(first_sentence)
         
         # Add generic mathematical misconceptions
-        generic_misconceptions = [
-            "This concept is only applicable in theoretical mathematics with no practical use",
-            "This is a simple concept that doesn't require formal definition",
-            "This concept is equivalent to its opposite in all contexts"
-        ]
-        distractors.extend(generic_misconceptions)
+        distractors.extend(_GENERIC_MISCONCEPTIONS)
         
-        # Truncate and ensure uniqueness
+        # Ensure uniqueness (candidates are already truncated)
         truncated_distractors = []
+        seen = set()
         for d in distractors[:3]:
-            truncated = d[:120] + "..." if len(d) > 120 else d
-            if truncated not in truncated_distractors:
-                truncated_distractors.append(truncated)
+            if d not in seen:
+                seen.add(d)
+                truncated_distractors.append(d)
         
         return truncated_distractors[:3]
     
     def generate_relationship_question(self, term: str) -> Tuple[str, str, List[str]]:
         """Generate a relationship-based question with mathematical precision"""
-        entry = self.glossary.get(term.lower())
+        term_lower = term.lower()
+        entry = self._glossary_lc.get(term_lower)
         if not entry or not entry.related_terms:
             return "", "", []
             
         related_term = random.choice(entry.related_terms)
-        related_entry = self.glossary.get(related_term.lower())
+        related_entry = self._glossary_lc.get(related_term.lower())
         
         if not related_entry:
             return "", "", []
             
         question = f"What is the precise mathematical relationship between '{entry.term}' and '{related_entry.term}'?"
-        correct_answer = f"According to the definition: {entry.definition}"
+        precomputed = self._precomputed[term_lower]
+        correct_answer = precomputed['relationship_answer']
         
         # Generate mathematically plausible distractors
         distractors = [
@@ -134,14 +200,13 @@ class EnhancedQuestionGenerator:
             f"{entry.term} can always be transformed into {related_entry.term} through a simple mapping"
         ]
         
-        options = [correct_answer[:150] + "..."] + distractors
-        random.shuffle(options)
+        options, _ = self._assemble_options(precomputed['relationship_trunc150'], distractors)
         
         return question, correct_answer, options
     
     def generate_category_question(self, term: str) -> Tuple[str, str, List[str]]:
         """Generate a category-based question"""
-        entry = self.glossary.get(term.lower())
+        entry = self._glossary_lc.get(term.lower())
         if not entry:
             return "", "", []
             
@@ -153,14 +218,14 @@ class EnhancedQuestionGenerator:
         distractors = [cat for cat in distractors if cat != entry.category]
         distractors = random.sample(distractors, min(3, len(distractors)))
         
-        options = [correct_answer] + distractors
-        random.shuffle(options)
+        options, _ = self._assemble_options(correct_answer, distractors)
         
         return question, correct_answer, options
     
     def generate_application_question(self, term: str) -> Tuple[str, str, List[str]]:
         """Generate an application-based question with theoretical grounding"""
-        entry = self.glossary.get(term.lower())
+        term_lower = term.lower()
+        entry = self._glossary_lc.get(term_lower)
         if not entry:
             return "", "", []
             
@@ -175,30 +240,20 @@ class EnhancedQuestionGenerator:
             "Only in hardware design and not in software verification"
         ]
         
-        options = [correct_answer[:150] + "..."] + distractors[:3]
-        random.shuffle(options)
+        options, _ = self._assemble_options(self._precomputed[term_lower]['trunc150'], distractors[:3])
         
         return question, correct_answer, options
     
     def generate_example_question(self, term: str) -> Tuple[str, str, List[str]]:
         """Generate an example-based question"""
-        entry = self.glossary.get(term.lower())
+        term_lower = term.lower()
+        entry = self._glossary_lc.get(term_lower)
         if not entry:
             return "", "", []
             
         question = f"Which of the following is a correct example of '{entry.term}'?"
-        # Extract example from definition if available
-        definition_parts = entry.definition.split('.')
-        example_part = None
-        for part in definition_parts:
-            if 'example' in part.lower() or 'for example' in part.lower():
-                example_part = part.strip()
-                break
-        
-        if example_part:
-            correct_answer = example_part
-        else:
-            correct_answer = entry.definition.split('.')[0] + "."  # First sentence often contains key info
+        precomputed = self._precomputed[term_lower]
+        correct_answer = precomputed['example_answer']
         
         # Generate plausible but incorrect examples
         distractors = [
@@ -207,7 +262,6 @@ class EnhancedQuestionGenerator:
             "A related concept that is often confused with the actual term"
         ]
         
-        options = [correct_answer[:150] + "..."] + distractors
-        random.shuffle(options)
+        options, _ = self._assemble_options(precomputed['example_trunc150'], distractors)
         
         return question, correct_answer, options
@@ -17,6 +17,12 @@ import os
 import sys
 import time
 import random
+import itertools
+import functools
+import sqlite3
+import signal
+from operator import attrgetter
+import uuid
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -33,10 +39,9 @@ try:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
+    from rich.prompt import Prompt, IntPrompt, Confirm
     from rich.markdown import Markdown
     from rich.text import Text
-    from rich.progress import track
     import colorama
     from colorama import Fore, Style
 except ImportError:
@@ -47,14 +52,41 @@ except ImportError:
 # Initialize colorama for cross-platform colored output
 colorama.init()
 
+# TIMESTAMP columns hold ISO 8601 text; the stdlib converter expects a space
+# separator, so decode them with fromisoformat when rows are fetched
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
 # Configuration
 CONFIG = {
     'DB_PATH': os.getenv('COMPU_LOGIC_DB_PATH', 'compulogic.db'),
     'REPORTS_DIR': 'reports',
     'MAX_HINTS': 3,
     'QUESTIONS_PER_SESSION': 10,
+    # Skip the typewriter animation and inter-question pauses (set to 0 to restore them)
+    'FAST_BOOT': os.getenv('COMPU_LOGIC_FAST', '1') == '1',
 }
 
+# Prompt choices for the fixed-size menus
+_MENU_CHOICES = ("1", "2", "3", "4", "5", "6", "7")
+_QUIZ_CHOICES = ("1", "2", "3", "4")
+
+@functools.lru_cache(maxsize=64)
+def _numeric_choices(n: int) -> Tuple[str, ...]:
+    """Prompt choices "1".."n" for variable-size menus"""
+    return tuple(str(i) for i in range(1, n + 1))
+
+# Shown after a bad menu answer; written straight to stderr so this path
+# needs no Rich markup parsing
+_INVALID_SELECTION = "Invalid selection. Please try again.\n"
+_INVALID_SELECTION_ANSI = "\x1b[31mInvalid selection. Please try again.\x1b[0m\n"
+
+def _report_invalid_selection() -> None:
+    """Write the invalid-selection message, in red only on a color terminal"""
+    if sys.stderr.isatty() and 'NO_COLOR' not in os.environ:
+        sys.stderr.write(_INVALID_SELECTION_ANSI)
+    else:
+        sys.stderr.write(_INVALID_SELECTION)
+
 # COMPU LOGIC ART DESIGN - BOLD AND ITALIAN GRAPHIC STYLE
 COMPU_LOGIC_ART = r"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -72,14 +104,50 @@ COMPU_LOGIC_ART = r"""
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+# Styled once at import so start() doesn't re-process the raw art each time
+COMPU_LOGIC_ART_TEXT = Text(COMPU_LOGIC_ART, style="bold blue", no_wrap=True)
+
+# Substring triggers used to classify glossary terms, checked in order.
+# Matching is by substring (e.g. 'set' also catches 'subset'), not whole words.
+_CATEGORY_TRIGGERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('Functions', ('function', 'bijective', 'injective', 'surjective', 'composition')),
+    ('Set Theory', ('set', 'subset', 'powerset', 'cartesian', 'characteristic')),
+    ('Relations', ('relation', 'equivalence', 'congruence')),
+    ('Orderings', ('order', 'ordering', 'lexicographic')),
+    ('Graphs', ('graph',)),
+    ('Data Structures', ('list', 'string', 'tuple')),
+    ('Multisets', ('multiset',)),
+    ('SMT Solvers', ('smt', 'solver', 'satisfiability', 'theory', 'model', 'bit-vector', 'array')),
+)
+
+_DIFFICULTY_TRIGGERS: Tuple[Tuple[int, Tuple[str, ...]], ...] = (
+    (5, ('characteristic function', 'composition', 'bijective', 'equivalence relation',
+         'lexicographic ordering', 'multiset ordering', 'strict ordering relation',
+         'smt solver', 'theory combination', 'congruence closure', 'quotient set')),
+    (4, ('function', 'relation', 'ordering', 'smt-lib')),
+    (3, ('set', 'cartesian', 'powerset', 'model')),
+    (2, ('list', 'graph', 'multiset', 'bit-vector')),
+)
+
+# Star rating strings indexed by difficulty (0-5)
+_DIFFICULTY_STARS: Tuple[str, ...] = tuple("★" * i + "☆" * (5 - i) for i in range(6))
+
 @dataclass
 class GlossaryEntry:
     """Data class for glossary entries"""
+    # Declared by hand (dataclass(slots=True) needs Python 3.10); slots rule
+    # out class-level defaults, so every field is passed at construction
+    __slots__ = ('term', 'definition', 'category', 'difficulty', 'related_terms',
+                 'definition_sentences', 'difficulty_stars', 'brief')
     term: str
     definition: str
     category: str
     difficulty: int  # 1-5
     related_terms: List[str]
+    # Display forms derived once at load time
+    definition_sentences: Tuple[str, ...]
+    difficulty_stars: str
+    brief: str
 
 @dataclass
 class UserProgress:
@@ -109,15 +177,61 @@ class QuestionResult:
 class DatabaseManager:
     """Manages SQLite database for user progress tracking"""
     
+    UPSERT_PROGRESS_SQL = '''
+        INSERT INTO user_progress
+        (user_id, term, attempts, correct_attempts, last_attempt, mastery_level)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, term) DO UPDATE SET
+            attempts = excluded.attempts,
+            correct_attempts = excluded.correct_attempts,
+            last_attempt = excluded.last_attempt,
+            mastery_level = excluded.mastery_level
+    '''
+
+    # Records one quiz attempt. A new row starts at 0.1 mastery if correct,
+    # else 0.0. An existing row gains 10% of the remaining gap on a correct
+    # answer, or loses 5% on a wrong one, never dropping below 0.1.
+    APPLY_ATTEMPT_SQL = '''
+        INSERT INTO user_progress
+        (user_id, term, attempts, correct_attempts, last_attempt, mastery_level)
+        VALUES (?, ?, 1, ?, ?, ?)
+        ON CONFLICT(user_id, term) DO UPDATE SET
+            attempts = attempts + 1,
+            correct_attempts = correct_attempts + excluded.correct_attempts,
+            last_attempt = excluded.last_attempt,
+            mastery_level = CASE WHEN excluded.correct_attempts > 0
+                THEN MIN(1.0, mastery_level + 0.1 * (1.0 - mastery_level))
+                ELSE MAX(0.1, mastery_level - 0.05 * mastery_level)
+            END
+    '''
+
+    INSERT_RESULT_SQL = '''
+        INSERT INTO question_results
+        (question_id, user_id, term, question_type, user_answer, 
+         correct_answer, passed, time_taken, feedback)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, db_path: str = None):
         self.db_path = db_path or CONFIG['DB_PATH']
+        # One connection for the whole session; autocommit mode so single
+        # statements don't hold a transaction open between calls
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                    detect_types=sqlite3.PARSE_DECLTYPES)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
         self.init_database()
 
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
     def init_database(self):
         """Initialize database tables"""
-        import sqlite3
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
 
         # Create user progress table
         cursor.execute('''
@@ -151,41 +265,52 @@ class DatabaseManager:
             )
         ''')
 
-        conn.commit()
-        conn.close()
-
-    def save_progress(self, progress: UserProgress):
-        """Save user progress to database"""
-        import sqlite3
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+        # Indexes for per-user lookups and the mastery-ordered progress view
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_qr_user
+            ON question_results(user_id, created_at)
+        ''')
         cursor.execute('''
-            INSERT INTO user_progress
-            (user_id, term, attempts, correct_attempts, last_attempt, mastery_level)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, term) DO UPDATE SET
-                attempts = excluded.attempts,
-                correct_attempts = excluded.correct_attempts,
-                last_attempt = excluded.last_attempt,
-                mastery_level = excluded.mastery_level
-        ''', (
+            CREATE INDEX IF NOT EXISTS idx_up_user
+            ON user_progress(user_id, mastery_level DESC)
+        ''')
+
+    @staticmethod
+    def _progress_row(progress: UserProgress) -> Tuple:
+        return (
             progress.user_id,
             progress.term,
             progress.attempts,
             progress.correct_attempts,
             progress.last_attempt.isoformat() if progress.last_attempt else None,
             progress.mastery_level
-        ))
+        )
+
+    @staticmethod
+    def _attempt_row(user_id: str, term: str, correct: bool, now_iso: str) -> Tuple:
+        return (user_id, term, 1 if correct else 0, now_iso, 0.1 if correct else 0.0)
+
+    @staticmethod
+    def _result_row(result: QuestionResult, user_id: str) -> Tuple:
+        return (
+            result.question_id,
+            user_id,
+            result.term,
+            result.question_type,
+            result.user_answer,
+            result.correct_answer,
+            result.passed,
+            result.time_taken,
+            result.feedback
+        )
 
-        conn.commit()
-        conn.close()
+    def save_progress(self, progress: UserProgress):
+        """Save user progress to database"""
+        self.conn.execute(self.UPSERT_PROGRESS_SQL, self._progress_row(progress))
 
     def get_user_progress(self, user_id: str, term: str = None) -> List[UserProgress]:
-        """Retrieve user progress from database"""
-        import sqlite3
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Retrieve user progress from database, highest mastery first"""
+        cursor = self.conn.cursor()
 
         if term:
             cursor.execute('''
@@ -196,50 +321,72 @@ class DatabaseManager:
             cursor.execute('''
                 SELECT * FROM user_progress 
                 WHERE user_id = ?
+                ORDER BY mastery_level DESC
             ''', (user_id,))
 
         rows = cursor.fetchall()
-        conn.close()
-
-        progress_list = []
-        for row in rows:
-            progress = UserProgress(
-                user_id=row[1],
-                term=row[2],
-                attempts=row[3] or 0,
-                correct_attempts=row[4] or 0,
-                last_attempt=datetime.fromisoformat(row[5]) if row[5] else None,
-                mastery_level=row[6] or 0.0
-            )
-            progress_list.append(progress)
 
-        return progress_list
+        return [self._row_to_progress(row) for row in rows]
+
+    def get_top_progress(self, user_id: str, limit: int) -> List[UserProgress]:
+        """Retrieve the user's `limit` highest-mastery progress rows"""
+        rows = self.conn.execute('''
+            SELECT * FROM user_progress
+            WHERE user_id = ?
+            ORDER BY mastery_level DESC
+            LIMIT ?
+        ''', (user_id, limit)).fetchall()
+
+        return [self._row_to_progress(row) for row in rows]
+
+    def get_user_summary(self, user_id: str) -> Tuple[int, float, int, int]:
+        """Aggregate the user's progress as (terms, avg mastery, attempts, correct attempts)"""
+        row = self.conn.execute('''
+            SELECT COUNT(*),
+                   COALESCE(AVG(COALESCE(mastery_level, 0.0)), 0.0),
+                   COALESCE(SUM(attempts), 0),
+                   COALESCE(SUM(correct_attempts), 0)
+            FROM user_progress
+            WHERE user_id = ?
+        ''', (user_id,)).fetchone()
+
+        return row[0], row[1], row[2], row[3]
+
+    @staticmethod
+    def _row_to_progress(row: sqlite3.Row) -> UserProgress:
+        return UserProgress(
+            user_id=row['user_id'],
+            term=row['term'],
+            attempts=row['attempts'] or 0,
+            correct_attempts=row['correct_attempts'] or 0,
+            last_attempt=row['last_attempt'],
+            mastery_level=row['mastery_level'] or 0.0
+        )
 
     def save_question_result(self, result: QuestionResult, user_id: str):
         """Save question result to database"""
-        import sqlite3
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.conn.execute(self.INSERT_RESULT_SQL, self._result_row(result, user_id))
 
-        cursor.execute('''
-            INSERT INTO question_results
-            (question_id, user_id, term, question_type, user_answer, 
-             correct_answer, passed, time_taken, feedback)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            result.question_id,
-            user_id,
-            result.term,
-            result.question_type,
-            result.user_answer,
-            result.correct_answer,
-            result.passed,
-            result.time_taken,
-            result.feedback
-        ))
+    def apply_attempt(self, user_id: str, term: str, correct: bool, now_iso: str):
+        """Record a quiz attempt and update mastery in a single statement"""
+        self.conn.execute(self.APPLY_ATTEMPT_SQL, self._attempt_row(user_id, term, correct, now_iso))
 
-        conn.commit()
-        conn.close()
+    def flush_results(self, results: List[QuestionResult], attempts: List[Tuple[str, bool, str]], user_id: str):
+        """Write a batch of question results and (term, correct, iso time) attempts in one transaction"""
+        if not results and not attempts:
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(self.INSERT_RESULT_SQL,
+                                  [self._result_row(result, user_id) for result in results])
+            self.conn.executemany(self.APPLY_ATTEMPT_SQL,
+                                  [self._attempt_row(user_id, term, correct, now_iso)
+                                   for term, correct, now_iso in attempts])
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
 class GlossaryManager:
     """Manages the theoretical computer science glossary"""
@@ -247,97 +394,87 @@ class GlossaryManager:
     def __init__(self):
         self.entries: Dict[str, GlossaryEntry] = {}
         self._load_glossary()
+        self._build_indexes()
 
     def _load_glossary(self):
         """Load glossary entries from the provided text"""
         glossary_definitions = get_enhanced_glossary()
         
-        # Process each entry with progress bar
-        console = Console()
-        for entry_data in track(glossary_definitions, description="Loading glossary entries..."):
-            term = entry_data["term"]
-            definition = entry_data["definition"]
-            
-            # Determine category and difficulty
-            category = self._categorize_term(term)
-            difficulty = self._assess_difficulty(term)
-            
-            # Find related terms
-            related_terms = self._find_related_terms(definition, term, glossary_definitions)
-            
-            # Create entry
-            entry = GlossaryEntry(
-                term=term,
-                definition=definition,
-                category=category,
-                difficulty=difficulty,
-                related_terms=related_terms
-            )
-            
-            self.entries[term.lower()] = entry
+        # Lowercase every term/definition and tokenize every term once, up front,
+        # so related-term discovery doesn't redo it for each pair of entries
+        all_terms = [entry_data["term"] for entry_data in glossary_definitions]
+        lowered = [(entry_data["term"].lower(), entry_data["definition"].lower())
+                   for entry_data in glossary_definitions]
+        term_words = [set(term_lower.split()) for term_lower, _ in lowered]
+        
+        # Process each entry; loading is in-memory and fast, so no progress bar
+        for i, entry_data in enumerate(glossary_definitions):
+            entry = _process_entry(i, entry_data, all_terms, lowered, term_words)
+            self.entries[entry.term.lower()] = entry
 
-    def _categorize_term(self, term: str) -> str:
+    @staticmethod
+    def _categorize_term(term: str) -> str:
         """Categorize a term based on its name"""
         term_lower = term.lower()
-        if any(word in term_lower for word in ['function', 'bijective', 'injective', 'surjective', 'composition']):
-            return 'Functions'
-        elif any(word in term_lower for word in ['set', 'subset', 'powerset', 'cartesian', 'characteristic']):
-            return 'Set Theory'
-        elif any(word in term_lower for word in ['relation', 'equivalence', 'congruence']):
-            return 'Relations'
-        elif any(word in term_lower for word in ['order', 'ordering', 'lexicographic']):
-            return 'Orderings'
-        elif any(word in term_lower for word in ['graph']):
-            return 'Graphs'
-        elif any(word in term_lower for word in ['list', 'string', 'tuple']):
-            return 'Data Structures'
-        elif any(word in term_lower for word in ['multiset']):
-            return 'Multisets'
-        elif any(word in term_lower for word in ['smt', 'solver', 'satisfiability', 'theory', 'model', 'bit-vector', 'array']):
-            return 'SMT Solvers'
-        else:
-            return 'General'
+        for category, triggers in _CATEGORY_TRIGGERS:
+            if any(word in term_lower for word in triggers):
+                return category
+        return 'General'
 
-    def _assess_difficulty(self, term: str) -> int:
+    @staticmethod
+    def _assess_difficulty(term: str) -> int:
         """Assess the difficulty level of a term (1-5)"""
         term_lower = term.lower()
-        complex_terms = ['characteristic function', 'composition', 'bijective', 'equivalence relation', 
-                        'lexicographic ordering', 'multiset ordering', 'strict ordering relation',
-                        'smt solver', 'theory combination', 'congruence closure', 'quotient set']
-        
-        if any(ct in term_lower for ct in complex_terms):
-            return 5
-        elif any(word in term_lower for word in ['function', 'relation', 'ordering', 'smt-lib']):
-            return 4
-        elif any(word in term_lower for word in ['set', 'cartesian', 'powerset', 'model']):
-            return 3
-        elif any(word in term_lower for word in ['list', 'graph', 'multiset', 'bit-vector']):
-            return 2
-        else:
-            return 1
-
-    def _find_related_terms(self, definition: str, current_term: str, all_definitions: List[Dict]) -> List[str]:
-        """Find related terms mentioned in the definition"""
+        for difficulty, triggers in _DIFFICULTY_TRIGGERS:
+            if any(word in term_lower for word in triggers):
+                return difficulty
+        return 1
+
+    @staticmethod
+    def _find_related_terms(index: int, all_terms: List[str], lowered: List[Tuple[str, str]],
+                            term_words: List[set]) -> List[str]:
+        """Find related terms mentioned in the definition of entry `index`"""
         related = []
-        definition_lower = definition.lower()
-        current_term_words = set(current_term.lower().split())
+        current_term_lower, definition_lower = lowered[index]
+        current_term_words = term_words[index]
         
-        for entry in all_definitions:
-            term = entry["term"]
-            if term.lower() == current_term.lower():
-                continue
-                
-            # Check for term mentions in definition
-            if term.lower() in definition_lower:
-                related.append(term)
+        for j, (term_lower, _) in enumerate(lowered):
+            if term_lower == current_term_lower:
                 continue
                 
-            # Check for shared conceptual words
-            term_words = set(term.lower().split())
-            if len(current_term_words.intersection(term_words)) >= 2:
-                related.append(term)
+            # Check for term mentions in definition, or shared conceptual words
+            if (definition_lower.find(term_lower) != -1 or
+                    len(current_term_words & term_words[j]) >= 2):
+                related.append(all_terms[j])
+                if len(related) == 5:  # Limit to 5 related terms
+                    break
         
-        return related[:5]  # Limit to 5 related terms
+        return related
+
+    def _build_indexes(self):
+        """Cache entry, category and per-category views used by the menus.
+
+        Must be called again after self.entries is modified.
+        """
+        self._entries_tuple: Tuple[GlossaryEntry, ...] = tuple(self.entries.values())
+        self._categories_sorted: Tuple[str, ...] = tuple(sorted({e.category for e in self._entries_tuple}))
+        by_category: Dict[str, List[GlossaryEntry]] = {}
+        by_difficulty: Dict[int, List[GlossaryEntry]] = {}
+        for entry in self._entries_tuple:
+            by_category.setdefault(entry.category, []).append(entry)
+            by_difficulty.setdefault(entry.difficulty, []).append(entry)
+        self._terms_by_category: Dict[str, Tuple[GlossaryEntry, ...]] = {
+            # Stored pre-sorted by term so the menus never sort on display
+            category: tuple(sorted(terms, key=attrgetter('term'))) for category, terms in by_category.items()
+        }
+        self._terms_by_difficulty: Dict[int, Tuple[GlossaryEntry, ...]] = {
+            difficulty: tuple(terms) for difficulty, terms in by_difficulty.items()
+        }
+        # One lowercased blob per entry so a search is a single substring check;
+        # the newline separators keep matches from spanning two fields
+        self._search_blobs: Tuple[str, ...] = tuple(
+            f"{e.term}\n{e.definition}\n{e.category}".lower() for e in self._entries_tuple
+        )
 
     def get_entry(self, term: str) -> Optional[GlossaryEntry]:
         """Get a glossary entry by term"""
@@ -346,28 +483,48 @@ class GlossaryManager:
     def search_entries(self, query: str) -> List[GlossaryEntry]:
         """Search for entries matching a query"""
         query_lower = query.lower()
-        results = []
-        
-        for entry in self.entries.values():
-            if (query_lower in entry.term.lower() or 
-                query_lower in entry.definition.lower() or
-                query_lower in entry.category.lower()):
-                results.append(entry)
-                
-        return results
+        return [entry for entry, blob in zip(self._entries_tuple, self._search_blobs)
+                if query_lower in blob]
+
+    def get_categories(self) -> Tuple[str, ...]:
+        """Get all categories, sorted alphabetically"""
+        return self._categories_sorted
 
-    def get_terms_by_category(self, category: str) -> List[GlossaryEntry]:
+    def get_terms_by_category(self, category: str) -> Tuple[GlossaryEntry, ...]:
         """Get all terms in a specific category"""
-        return [entry for entry in self.entries.values() if entry.category == category]
+        return self._terms_by_category.get(category, ())
 
     def get_terms_by_difficulty(self, difficulty: int) -> List[GlossaryEntry]:
         """Get all terms of a specific difficulty level"""
-        return [entry for entry in self.entries.values() if entry.difficulty == difficulty]
+        return list(self._terms_by_difficulty.get(difficulty, ()))
 
     def get_random_term_of_the_day(self) -> GlossaryEntry:
         """Get a random term for the 'Term of the Day' feature"""
-        terms = list(self.entries.values())
-        return random.choice(terms) if terms else None
+        return random.choice(self._entries_tuple) if self._entries_tuple else None
+
+def _process_entry(index: int, entry_data: Dict[str, str], all_terms: List[str],
+                   lowered: List[Tuple[str, str]], term_words: List[set]) -> GlossaryEntry:
+    """Build the GlossaryEntry for raw glossary item `index` (no shared state is mutated)"""
+    term = entry_data["term"]
+    definition = entry_data["definition"]
+    
+    # Determine category and difficulty
+    category = GlossaryManager._categorize_term(term)
+    difficulty = GlossaryManager._assess_difficulty(term)
+    
+    # Find related terms
+    related_terms = GlossaryManager._find_related_terms(index, all_terms, lowered, term_words)
+    
+    return GlossaryEntry(
+        term=term,
+        definition=definition,
+        category=sys.intern(category),
+        difficulty=difficulty,
+        related_terms=related_terms,
+        definition_sentences=tuple(s.strip() for s in definition.split('. ') if s.strip()),
+        difficulty_stars=_DIFFICULTY_STARS[difficulty],
+        brief=definition[:80] + "..." if len(definition) > 80 else definition
+    )
 
 class CompuLogic:
     """Main CompuLogic application class"""
@@ -377,13 +534,23 @@ class CompuLogic:
         self.db_manager = DatabaseManager()
         self.glossary_manager = GlossaryManager()
         self.question_generator = EnhancedQuestionGenerator(self.glossary_manager.entries)
+        self.validator = AnswerValidator()
         self.current_user = None
         self.session_questions = 0
+        # Quiz write-backs are buffered and flushed in one transaction per quiz
+        self._pending_results: List[QuestionResult] = []
+        self._pending_attempts: List[Tuple[str, bool, str]] = []
+        # Question ids are session-scoped counters rather than timestamps
+        self._session_id = uuid.uuid4().hex[:8]
+        self._q_counter = itertools.count()
+        # Ctrl+C during a flush is deferred until the batch has committed
+        self._flushing = False
+        self._interrupt_pending = False
 
     def start(self):
         """Start the CompuLogic application with animation"""
         self._show_startup_animation()
-        self.console.print(COMPU_LOGIC_ART, style="bold blue")
+        self.console.print(COMPU_LOGIC_ART_TEXT)
         self.console.print("\n[bold green]Welcome to COMPU LOGIC - Your Theoretical Computer Science Learning Assistant![/bold green]\n")
         self.console.print("[italic]Mastering Logic, Sets, Functions, and Formal Methods[/italic]\n")
         
@@ -410,6 +577,10 @@ class CompuLogic:
             "System ready!"
         ]
         
+        if CONFIG['FAST_BOOT']:
+            self.console.print("\n".join(initialization_messages), style="cyan")
+            return
+        
         for message in initialization_messages:
             for char in message:
                 self.console.print(char, end="", style="cyan")
@@ -430,7 +601,7 @@ class CompuLogic:
             self.console.print("6. Help")
             self.console.print("7. Exit")
             
-            choice = Prompt.ask("[bold yellow]Select an option[/bold yellow]", choices=["1", "2", "3", "4", "5", "6", "7"])
+            choice = Prompt.ask("[bold yellow]Select an option[/bold yellow]", choices=_MENU_CHOICES)
             
             if choice == "1":
                 self._interactive_glossary()
@@ -480,60 +651,65 @@ This application helps you learn theoretical computer science concepts through i
         self.console.print("\n[bold cyan]=== Interactive Glossary ===[/bold cyan]")
         
         # Show categories
-        categories = list(set(entry.category for entry in self.glossary_manager.entries.values()))
-        self.console.print("[bold]Available Categories:[/bold]")
-        for i, category in enumerate(sorted(categories), 1):
-            count = len(self.glossary_manager.get_terms_by_category(category))
-            self.console.print(f"{i}. {category} ({count} terms)")
-        
+        categories = self.glossary_manager.get_categories()  # Sorted alphabetically
+        # Hold the listing in Rich's buffer and write it out once on exit
+        with self.console:
+            self.console.print("[bold]Available Categories:[/bold]")
+            for i, category in enumerate(categories, 1):
+                count = len(self.glossary_manager.get_terms_by_category(category))
+                self.console.print(f"{i}. {category} ({count} terms)")
+        
+        # Only the conversion and lookup can fail, so only they are guarded
         try:
             cat_choice = int(Prompt.ask("[bold yellow]Select a category[/bold yellow]", 
-                                      choices=[str(i) for i in range(1, len(categories) + 1)]))
-            selected_category = sorted(categories)[cat_choice - 1]
-            
-            # Show terms in category
-            terms = self.glossary_manager.get_terms_by_category(selected_category)
-            # Sort terms alphabetically
-            terms.sort(key=lambda x: x.term)
-            
+                                      choices=_numeric_choices(len(categories))))
+            selected_category = categories[cat_choice - 1]
+        except (ValueError, IndexError):
+            _report_invalid_selection()
+            return
+        
+        # Show terms in category
+        terms = self.glossary_manager.get_terms_by_category(selected_category)  # Sorted by term
+        
+        with self.console:
             self.console.print(f"\n[bold]{selected_category} Terms:[/bold]")
             
             for i, entry in enumerate(terms, 1):
-                difficulty_stars = "★" * entry.difficulty + "☆" * (5 - entry.difficulty)
+                difficulty_stars = entry.difficulty_stars
                 self.console.print(f"{i}. [bold]{entry.term}[/bold] {difficulty_stars}")
-            
+        
+        try:
             term_choice = int(Prompt.ask("[bold yellow]Select a term to view details[/bold yellow]", 
-                                       choices=[str(i) for i in range(1, len(terms) + 1)]))
+                                       choices=_numeric_choices(len(terms))))
             selected_entry = terms[term_choice - 1]
-            
-            self._display_term_details(selected_entry)
-            
         except (ValueError, IndexError):
-            self.console.print("[red]Invalid selection. Please try again.[/red]")
+            _report_invalid_selection()
+            return
+        
+        self._display_term_details(selected_entry)
 
     def _display_term_details(self, entry: GlossaryEntry):
         """Display detailed information about a term"""
-        self.console.print(f"\n[bold blue]=== {entry.term} ===[/bold blue]")
-        self.console.print(f"[italic]Category: {entry.category} | Difficulty: {'★' * entry.difficulty}[/italic]\n")
-        
-        # Format definition with better readability
-        definition_lines = entry.definition.split('. ')
-        for line in definition_lines:
-            if line.strip():
-                self.console.print(f"• {line.strip()}.")
-        
-        # Show related terms
-        if entry.related_terms:
-            self.console.print(f"\n[bold]Related Terms:[/bold]")
-            for related in entry.related_terms[:3]:  # Show first 3
-                self.console.print(f"  → {related}")
-        
-        # Show user progress
-        progress = self.db_manager.get_user_progress(self.current_user, entry.term)
-        if progress:
-            p = progress[0]
-            mastery = p.get_mastery_percentage()
-            self.console.print(f"\n[bold]Your Progress:[/bold] {mastery}% mastery ({p.correct_attempts}/{p.attempts} correct)")
+        with self.console:
+            self.console.print(f"\n[bold blue]=== {entry.term} ===[/bold blue]")
+            self.console.print(f"[italic]Category: {entry.category} | Difficulty: {'★' * entry.difficulty}[/italic]\n")
+            
+            # Format definition with better readability
+            for line in entry.definition_sentences:
+                self.console.print(f"• {line}.")
+            
+            # Show related terms
+            if entry.related_terms:
+                self.console.print(f"\n[bold]Related Terms:[/bold]")
+                for related in entry.related_terms[:3]:  # Show first 3
+                    self.console.print(f"  → {related}")
+            
+            # Show user progress
+            progress = self.db_manager.get_user_progress(self.current_user, entry.term)
+            if progress:
+                p = progress[0]
+                mastery = p.get_mastery_percentage()
+                self.console.print(f"\n[bold]Your Progress:[/bold] {mastery}% mastery ({p.correct_attempts}/{p.attempts} correct)")
 
     def _take_quiz(self):
         """Take an adaptive quiz"""
@@ -547,71 +723,78 @@ This application helps you learn theoretical computer science concepts through i
         correct_count = 0
         total_questions = len(selected_terms)
         
-        for i, term in enumerate(selected_terms, 1):
-            self.console.print(f"\n[bold blue]Question {i}/{total_questions}[/bold blue]")
-            
-            # Randomly select question type
-            question_types = [
-                self.question_generator.generate_definition_question,
-                self.question_generator.generate_category_question,
-                self.question_generator.generate_relationship_question,
-                self.question_generator.generate_application_question,
-                self.question_generator.generate_example_question
-            ]
+        # Randomly select every question type up front in one draw
+        question_types = [
+            self.question_generator.generate_definition_question,
+            self.question_generator.generate_category_question,
+            self.question_generator.generate_relationship_question,
+            self.question_generator.generate_application_question,
+            self.question_generator.generate_example_question
+        ]
+        question_funcs = random.choices(question_types, k=total_questions)
+        
+        # Build the answer prompt once; its markup is parsed here rather than
+        # on every question
+        answer_prompt = Prompt("\n[yellow]Your answer (1-4)[/yellow]", console=self.console,
+                               choices=_QUIZ_CHOICES)
+        
+        try:
+            for i, (term, question_func) in enumerate(zip(selected_terms, question_funcs), 1):
+                self.console.print(f"\n[bold blue]Question {i}/{total_questions}[/bold blue]")
             
-            question_func = random.choice(question_types)
-            question, correct_answer, options = question_func(term)
+                question, correct_answer, options = question_func(term)
             
-            if not question:
-                continue
+                if not question:
+                    continue
                 
-            self.console.print(f"[bold]{question}[/bold]\n")
+                self.console.print(f"[bold]{question}[/bold]\n")
             
-            # Display options
-            for j, option in enumerate(options, 1):
-                self.console.print(f"{j}. {option}")
+                # Display options
+                for j, option in enumerate(options, 1):
+                    self.console.print(f"{j}. {option}")
             
-            # Get user answer
-            start_time = time.time()
-            try:
-                user_choice = int(Prompt.ask("\n[yellow]Your answer (1-4)[/yellow]", 
-                                           choices=[str(i) for i in range(1, 5)]))
-                user_answer = options[user_choice - 1]
-            except (ValueError, IndexError):
-                user_answer = "Invalid selection"
+                # Get user answer
+                start_time = time.time()
+                try:
+                    user_choice = int(answer_prompt())
+                    user_answer = options[user_choice - 1]
+                except (ValueError, IndexError):
+                    user_answer = "Invalid selection"
                 
-            time_taken = time.time() - start_time
+                time_taken = time.time() - start_time
             
-            # Check answer
-            validator = AnswerValidator()
-            is_correct, feedback_msg = validator.validate_answer(user_answer, correct_answer)
+                # Check answer
+                is_correct, feedback_msg = self.validator.validate_answer(user_answer, correct_answer)
             
-            if is_correct:
-                correct_count += 1
-                self.console.print(f"[green]✓ Correct! {feedback_msg}[/green]")
-            else:
-                self.console.print("[red]✗ Incorrect.[/red]")
-                self.console.print(f"[italic]Correct answer: {correct_answer[:100]}...[/italic]")
+                if is_correct:
+                    correct_count += 1
+                    self.console.print(f"[green]✓ Correct! {feedback_msg}[/green]")
+                else:
+                    self.console.print("[red]✗ Incorrect.[/red]")
+                    self.console.print(f"[italic]Correct answer: {correct_answer[:100]}...[/italic]")
             
-            # Save result
-            result = QuestionResult(
-                question_id=f"quiz_{datetime.now().timestamp()}",
-                term=term,
-                question_type=question_func.__name__,
-                user_answer=user_answer,
-                correct_answer=correct_answer,
-                passed=is_correct,
-                time_taken=time_taken,
-                feedback=feedback_msg if is_correct else "Incorrect"
-            )
+                # Save result
+                result = QuestionResult(
+                    question_id=f"quiz_{self._session_id}_{next(self._q_counter)}",
+                    term=term,
+                    question_type=question_func.__name__,
+                    user_answer=user_answer,
+                    correct_answer=correct_answer,
+                    passed=is_correct,
+                    time_taken=time_taken,
+                    feedback=feedback_msg if is_correct else "Incorrect"
+                )
             
-            self.db_manager.save_question_result(result, self.current_user)
+                self._pending_results.append(result)
             
-            # Update progress
-            self._update_progress(term, is_correct)
+                # Update progress
+                self._update_progress(term, is_correct)
             
-            # Pause between questions
-            time.sleep(1)
+                # Pause between questions
+                if not CONFIG['FAST_BOOT']:
+                    time.sleep(1)
+        finally:
+            self._flush_pending()
         
         # Show results
         score = (correct_count / total_questions) * 100 if total_questions > 0 else 0
@@ -626,46 +809,43 @@ This application helps you learn theoretical computer science concepts through i
             self.console.print("[bold red]Keep studying! Review the glossary entries for more practice.[/bold red]")
 
     def _update_progress(self, term: str, correct: bool):
-        """Update user progress for a term with improved mastery calculation"""
-        progress_list = self.db_manager.get_user_progress(self.current_user, term)
-        
-        if progress_list:
-            progress = progress_list[0]
-            progress.attempts += 1
-            if correct:
-                progress.correct_attempts += 1
-                # Improved mastery calculation with diminishing returns
-                improvement = 0.1 * (1.0 - progress.mastery_level)
-                progress.mastery_level = min(1.0, progress.mastery_level + improvement)
-            else:
-                # Decrease mastery when incorrect, but not below 0.1
-                decrement = 0.05 * progress.mastery_level
-                progress.mastery_level = max(0.1, progress.mastery_level - decrement)
-        else:
-            progress = UserProgress(
-                user_id=self.current_user,
-                term=term,
-                attempts=1,
-                correct_attempts=1 if correct else 0,
-                last_attempt=datetime.now(),
-                mastery_level=0.1 if correct else 0.0
-            )
-        
-        progress.last_attempt = datetime.now()
-        self.db_manager.save_progress(progress)
+        """Record an attempt on a term; mastery is recomputed in SQL when flushed"""
+        self._pending_attempts.append((term, correct, datetime.now().isoformat()))
+
+    def _flush_pending(self):
+        """Persist buffered quiz results and attempts in a single transaction"""
+        self._flushing = True
+        try:
+            self.db_manager.flush_results(self._pending_results, self._pending_attempts, self.current_user)
+            self._pending_results.clear()
+            self._pending_attempts.clear()
+        finally:
+            self._flushing = False
+        if self._interrupt_pending:
+            self._handle_interrupt()
+
+    def _handle_interrupt(self, signum=None, frame=None):
+        """SIGINT handler: save buffered quiz answers, then exit immediately"""
+        if self._flushing:
+            self._interrupt_pending = True
+            return
+        self._interrupt_pending = False
+        self._flush_pending()
+        self.db_manager.close()
+        _exit_on_interrupt()
 
     def _view_progress(self):
         """View user progress"""
         self.console.print("\n[bold cyan]=== Your Learning Progress ===[/bold cyan]")
         
-        progress_list = self.db_manager.get_user_progress(self.current_user)
+        # Aggregates and the top rows are computed in SQL; only 15 rows come back
+        total_terms, avg_mastery, total_attempts, total_correct = self.db_manager.get_user_summary(self.current_user)
         
-        if not progress_list:
+        if not total_terms:
             self.console.print("[yellow]No progress data available yet. Take a quiz to get started![/yellow]")
             return
             
-        # Sort by mastery level
-        progress_list.sort(key=lambda p: p.mastery_level, reverse=True)
+        progress_list = self.db_manager.get_top_progress(self.current_user, 15)  # Show top 15
         
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Term", style="cyan")
@@ -674,8 +854,9 @@ This application helps you learn theoretical computer science concepts through i
         table.add_column("Success Rate", style="blue")
         table.add_column("Mastery", style="red")
         
-        for progress in progress_list[:15]:  # Show top 15
-            entry = self.glossary_manager.get_entry(progress.term)
+        get_entry = self.glossary_manager.get_entry
+        for progress in progress_list:
+            entry = get_entry(progress.term)
             category = entry.category if entry else "Unknown"
             
             success_rate = (progress.correct_attempts / progress.attempts * 100) if progress.attempts > 0 else 0
@@ -690,16 +871,13 @@ This application helps you learn theoretical computer science concepts through i
         self.console.print(table)
         
         # Summary statistics
-        total_terms = len(progress_list)
-        avg_mastery = sum(p.mastery_level for p in progress_list) / total_terms if total_terms > 0 else 0
-        total_attempts = sum(p.attempts for p in progress_list)
-        total_correct = sum(p.correct_attempts for p in progress_list)
         overall_success = (total_correct / total_attempts * 100) if total_attempts > 0 else 0
         
-        self.console.print(f"\n[bold]Summary:[/bold]")
-        self.console.print(f"Terms Studied: {total_terms}")
-        self.console.print(f"Average Mastery: {avg_mastery*100:.1f}%")
-        self.console.print(f"Overall Success Rate: {overall_success:.1f}%")
+        with self.console:
+            self.console.print(f"\n[bold]Summary:[/bold]")
+            self.console.print(f"Terms Studied: {total_terms}")
+            self.console.print(f"Average Mastery: {avg_mastery*100:.1f}%")
+            self.console.print(f"Overall Success Rate: {overall_success:.1f}%")
 
     def _search_terms(self):
         """Search for terms in the glossary"""
@@ -715,65 +893,72 @@ This application helps you learn theoretical computer science concepts through i
             self.console.print("[yellow]No matching terms found.[/yellow]")
             return
             
-        self.console.print(f"\n[bold]Found {len(results)} matching terms:[/bold]")
-        
-        # Sort results alphabetically
-        results.sort(key=lambda x: x.term)
-        
-        for i, entry in enumerate(results[:10], 1):  # Show first 10 results
-            difficulty_stars = "★" * entry.difficulty + "☆" * (5 - entry.difficulty)
-            self.console.print(f"{i}. [bold]{entry.term}[/bold] ({entry.category}) {difficulty_stars}")
+        with self.console:
+            self.console.print(f"\n[bold]Found {len(results)} matching terms:[/bold]")
+            
+            # Sort results alphabetically
+            results.sort(key=attrgetter('term'))
             
-        if len(results) > 10:
-            self.console.print(f"[italic]... and {len(results) - 10} more results[/italic]")
+            for i, entry in enumerate(results[:10], 1):  # Show first 10 results
+                difficulty_stars = entry.difficulty_stars
+                self.console.print(f"{i}. [bold]{entry.term}[/bold] ({entry.category}) {difficulty_stars}")
+                
+            if len(results) > 10:
+                self.console.print(f"[italic]... and {len(results) - 10} more results[/italic]")
 
     def _study_by_category(self):
         """Study terms organized by category"""
         self.console.print("\n[bold cyan]=== Study by Category ===[/bold cyan]")
         
-        categories = list(set(entry.category for entry in self.glossary_manager.entries.values()))
-        categories.sort()  # Sort alphabetically
-        
-        for i, category in enumerate(categories, 1):
-            terms = self.glossary_manager.get_terms_by_category(category)
-            avg_difficulty = sum(t.difficulty for t in terms) / len(terms) if terms else 0
-            self.console.print(f"{i}. [bold]{category}[/bold] ({len(terms)} terms, avg difficulty: {'★' * round(avg_difficulty)})")
-        
-        try:
-            choice = int(Prompt.ask("[bold yellow]Select a category to study[/bold yellow]", 
-                                  choices=[str(i) for i in range(1, len(categories) + 1)]))
-            selected_category = categories[choice - 1]
-            
-            self.console.print(f"\n[bold blue]=== {selected_category} ===[/bold blue]")
-            terms = self.glossary_manager.get_terms_by_category(selected_category)
-            # Sort terms alphabetically
-            terms.sort(key=lambda x: x.term)
-            
-            for entry in terms:
-                difficulty_stars = "★" * entry.difficulty + "☆" * (5 - entry.difficulty)
-                self.console.print(f"• [bold]{entry.term}[/bold] {difficulty_stars}")
-                # Show brief definition
-                brief_def = entry.definition[:80] + "..." if len(entry.definition) > 80 else entry.definition
-                self.console.print(f"  {brief_def}\n")
-                
-        except (ValueError, IndexError):
-            self.console.print("[red]Invalid selection.[/red]")
+        categories = self.glossary_manager.get_categories()  # Sorted alphabetically
+        
+        with self.console:
+            for i, category in enumerate(categories, 1):
+                terms = self.glossary_manager.get_terms_by_category(category)
+                avg_difficulty = sum(t.difficulty for t in terms) / len(terms) if terms else 0
+                self.console.print(f"{i}. [bold]{category}[/bold] ({len(terms)} terms, avg difficulty: {'★' * round(avg_difficulty)})")
+        
+        # IntPrompt re-asks until the answer is one of the choices, so the
+        # index below is always in range
+        choice = IntPrompt.ask("[bold yellow]Select a category to study[/bold yellow]",
+                               choices=_numeric_choices(len(categories)))
+        selected_category = categories[choice - 1]
+        
+        # A Text title is rendered as-is, with no markup parsing
+        self.console.rule(Text(selected_category, style="bold blue"), style="bold blue")
+        terms = self.glossary_manager.get_terms_by_category(selected_category)  # Sorted by term
+        
+        # Build the whole listing first and print it once, so Rich parses
+        # markup and renders a single time instead of twice per term
+        if terms:
+            # Each term contributes its precomputed stars and brief definition
+            self.console.print("\n".join(
+                f"• [bold]{entry.term}[/bold] {entry.difficulty_stars}\n  {entry.brief}\n"
+                for entry in terms
+            ))
 
     def _exit(self):
         """Exit the application"""
-        self.console.print("\n[bold green]Thank you for using COMPU LOGIC! Arrivederci![/bold green]")
-        self.console.print("[italic]Keep exploring the fascinating world of theoretical computer science![/italic]")
+        self.db_manager.close()
+        self.console.print("\n[bold green]Thank you for using COMPU LOGIC! Arrivederci![/bold green]\n"
+                           "[italic]Keep exploring the fascinating world of theoretical computer science![/italic]")
+
+def _exit_on_interrupt(signum=None, frame=None):
+    """Say goodbye and leave without unwinding the interpreter stack"""
+    sys.stderr.write("\n\nCOMPU LOGIC interrupted. Arrivederci!\n")
+    os._exit(0)
 
 def main():
     """Main entry point"""
+    # Ctrl+C exits straight from the signal handler instead of raising
+    # KeyboardInterrupt; once the app exists its handler saves pending answers
+    signal.signal(signal.SIGINT, _exit_on_interrupt)
     try:
         app = CompuLogic()
+        signal.signal(signal.SIGINT, app._handle_interrupt)
         app.start()
-    except KeyboardInterrupt:
-        print("\n\n[bold red]COMPU LOGIC interrupted. Arrivederci![/bold red]")
-        sys.exit(0)
     except Exception as e:
-        print(f"\n[bold red]Fatal error: {e}[/bold red]")
+        sys.stderr.write(f"\nFatal error: {e}\n")
         sys.exit(1)
 
 if __name__ == "__main__":